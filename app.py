@@ -156,7 +156,108 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
-# Load dataset
+RESPONSE_COL = 'Emergency Services Response Time (min)'
+# Response times are recorded to 0.1 min, so every value lands exactly on a 0.1 min grid
+RESPONSE_BIN_WIDTH = 0.1
+RESPONSE_KEY_COLS = ['State', 'Severity', 'Year', 'Weather Condition']
+
+# Precompute response-time aggregates so filters and breakdowns never rescan rows
+def build_response_store(df, entity_col):
+    times = df[RESPONSE_COL].dropna()
+    valid = df.loc[times.index]
+    grouped = valid.groupby(RESPONSE_KEY_COLS + [entity_col], dropna=False)[RESPONSE_COL]
+    cells = grouped.agg(['count', 'sum', 'min', 'max']).reset_index()
+
+    # Mergeable quantile summary: per-cell counts on a fixed response-time grid
+    steps = times.to_numpy() / RESPONSE_BIN_WIDTH
+    if (times < 0).any() or not np.allclose(steps, np.rint(steps)):
+        raise ValueError(f"'{RESPONSE_COL}' must hold non-negative values on a {RESPONSE_BIN_WIDTH} min grid")
+    steps = np.rint(steps).astype(int)
+    offset = steps.min() if len(steps) else 0
+    n_bins = steps.max() - offset + 1 if len(steps) else 1
+    hist = np.zeros((len(cells), n_bins), dtype=np.int64)
+    np.add.at(hist, (grouped.ngroup().to_numpy(), steps - offset), 1)
+    grid = np.round((offset + np.arange(n_bins)) * RESPONSE_BIN_WIDTH, 1)
+    # Cells are kept as plain arrays so filtering and merging skip pandas overhead
+    return {'cells': {col: cells[col].to_numpy() for col in cells.columns}, 'hist': hist, 'grid': grid}
+
+def filter_response_store(store, year_range, states, weather, severity):
+    cells = store['cells']
+    mask = (cells['Year'] >= year_range[0]) & (cells['Year'] <= year_range[1])
+    if states:
+        mask &= np.isin(cells['State'], states)
+    if weather:
+        mask &= np.isin(cells['Weather Condition'], weather)
+    if severity:
+        mask &= np.isin(cells['Severity'], severity)
+    return {'cells': {col: values[mask] for col, values in cells.items()}, 'hist': store['hist'][mask], 'grid': store['grid']}
+
+def merge_response_store(store, by=None):
+    cells = store['cells']
+    if by is None:
+        codes = np.zeros(len(cells['count']), dtype=int)
+        n_groups = 1 if len(codes) else 0
+        summary = {}
+    else:
+        codes, labels = pd.factorize(cells[by], sort=True, use_na_sentinel=False)
+        n_groups = len(labels)
+        summary = {by: labels}
+
+    count = np.bincount(codes, weights=cells['count'], minlength=n_groups)
+    total = np.bincount(codes, weights=cells['sum'], minlength=n_groups)
+    mins = np.full(n_groups, np.inf)
+    np.minimum.at(mins, codes, cells['min'])
+    maxs = np.full(n_groups, -np.inf)
+    np.maximum.at(maxs, codes, cells['max'])
+    summary.update({'count': count.astype(np.int64), 'min': mins, 'max': maxs, 'mean': total / count})
+
+    # Merge the quantile summaries of every cell in each group
+    if n_groups:
+        order = np.argsort(codes, kind='stable')
+        starts = np.searchsorted(codes[order], np.arange(n_groups))
+        hist = np.add.reduceat(store['hist'][order], starts, axis=0)
+    else:
+        hist = np.zeros((0, store['hist'].shape[1]), dtype=np.int64)
+    return summary, hist
+
+def add_response_percentiles(summary, hist, grid, quantiles=(0.25, 0.5, 0.75, 0.9)):
+    cumulative = hist.cumsum(axis=1)
+    count = summary['count']
+
+    def value_at_rank(rank):
+        return grid[(cumulative >= rank[:, None]).argmax(axis=1)]
+
+    # Linear interpolation between neighbouring ranks, as pandas and plotly compute it
+    for q in quantiles:
+        position = q * (count - 1)
+        lower_rank = np.floor(position) + 1
+        lower = value_at_rank(lower_rank)
+        upper = value_at_rank(np.minimum(lower_rank + 1, count))
+        # Interpolating on the 0.1 min grid never needs more than three decimals
+        summary[f'p{int(q * 100)}'] = np.round(lower + (position - np.floor(position)) * (upper - lower), 3)
+    return summary
+
+def summarize_response(store, by=None, quantiles=(0.25, 0.5, 0.75, 0.9)):
+    summary, hist = merge_response_store(store, by)
+    return pd.DataFrame(add_response_percentiles(summary, hist, store['grid'], quantiles))
+
+def summarize_response_box(store, by):
+    summary, hist = merge_response_store(store, by)
+    summary = add_response_percentiles(summary, hist, store['grid'], quantiles=(0.25, 0.5, 0.75))
+
+    # Whiskers follow the 1.5 x IQR rule, with points beyond them drawn as outliers
+    lowerfences, upperfences, outliers = [], [], []
+    for p25, p75, counts in zip(summary['p25'], summary['p75'], hist):
+        values = store['grid'][counts > 0]
+        iqr = p75 - p25
+        inside = (values >= p25 - 1.5 * iqr) & (values <= p75 + 1.5 * iqr)
+        lowerfences.append(values[inside].min())
+        upperfences.append(values[inside].max())
+        outliers.append(values[~inside].tolist())
+    summary.update({'lowerfence': lowerfences, 'upperfence': upperfences, 'outliers': outliers})
+    return pd.DataFrame(summary)
+
+# Load dataset along with its response-time stores, so both are cached together
 @st.cache_data
 def load_data():
     df = pd.read_csv("indian_accident_dataset_1000.csv", parse_dates=["Date"])
@@ -165,9 +266,9 @@ def load_data():
     df['Month_num'] = df['Date'].dt.month
     df['Day'] = df['Date'].dt.day_name()
     df['Hour'] = pd.to_datetime(df['Time'], format='%H:%M:%S').dt.hour
-    return df
+    return df, build_response_store(df, 'City'), build_response_store(df, 'Hospital Admitted To')
 
-df = load_data()
+df, city_response_store, hospital_response_store = load_data()
 
 # Sidebar with improved styling
 with st.sidebar:
@@ -236,6 +337,10 @@ if selected_weather:
 if selected_severity:
     filtered_df = filtered_df[filtered_df['Severity'].isin(selected_severity)]
 
+city_response = filter_response_store(city_response_store, selected_year_range, selected_state, selected_weather, selected_severity)
+hospital_response = filter_response_store(hospital_response_store, selected_year_range, selected_state, selected_weather, selected_severity)
+overall_response = summarize_response(city_response)
+
 # Function to request Groq summary with improved prompt
 def get_groq_summary(prompt):
     try:
@@ -274,7 +379,7 @@ with col2:
     st.markdown("</div>", unsafe_allow_html=True)
 
 with col3:
-    avg_response = round(filtered_df['Emergency Services Response Time (min)'].mean(), 1)
+    avg_response = round(overall_response['mean'].iloc[0], 1) if not overall_response.empty else "N/A"
     st.markdown("<div class='metric-card'>", unsafe_allow_html=True)
     st.markdown(f"<div class='metric-value'>{avg_response}</div>", unsafe_allow_html=True)
     st.markdown("<div class='metric-label'>Avg. Response Time (min)</div>", unsafe_allow_html=True)
@@ -463,15 +568,36 @@ with tab1:
         st.markdown("<h3 class='chart-title'>⏱️ Response Time vs Severity</h3>", unsafe_allow_html=True)
         
         if not filtered_df.empty:
-            fig = px.box(
-                filtered_df,
-                x='Severity',
-                y='Emergency Services Response Time (min)',
-                color='Severity',
-                color_discrete_sequence=px.colors.sequential.Oranges,
-                height=250
-            )
+            # Boxes are drawn from the precomputed quartiles and IQR fences.
+            # Severities keep the dataset's order and colours, as px.box assigned them.
+            severity_order = list(df['Severity'].unique())
+            colors = px.colors.sequential.Oranges
+            severity_response = summarize_response_box(city_response, by='Severity')
+            severity_response = severity_response.sort_values('Severity', key=lambda s: s.map(severity_order.index))
+            fig = go.Figure()
+            for _, row in severity_response.iterrows():
+                color = colors[severity_order.index(row['Severity']) % len(colors)]
+                fig.add_trace(go.Box(
+                    name=row['Severity'],
+                    q1=[row['p25']],
+                    median=[row['p50']],
+                    q3=[row['p75']],
+                    lowerfence=[row['lowerfence']],
+                    upperfence=[row['upperfence']],
+                    marker_color=color
+                ))
+                if row['outliers']:
+                    fig.add_trace(go.Scatter(
+                        name=row['Severity'],
+                        x=[row['Severity']] * len(row['outliers']),
+                        y=row['outliers'],
+                        mode='markers',
+                        marker_color=color,
+                        showlegend=False,
+                        hovertemplate="%{x}<br>Outlier: %{y} min<extra></extra>"
+                    ))
             fig.update_layout(
+                height=250,
                 margin=dict(l=20, r=20, t=30, b=10),
                 xaxis_title=None,
                 yaxis_title="Minutes",
@@ -484,6 +610,37 @@ with tab1:
             st.info("No data available for the selected filters.")
         st.markdown("</div>", unsafe_allow_html=True)
 
+    # Fourth row - response time by hospital
+    st.markdown("<div class='chart-container'>", unsafe_allow_html=True)
+    st.markdown("<h3 class='chart-title'>🏥 Response Time by Hospital</h3>", unsafe_allow_html=True)
+
+    if not filtered_df.empty:
+        hospital_data = summarize_response(hospital_response, by='Hospital Admitted To')
+
+        fig = px.bar(
+            hospital_data,
+            x='mean',
+            y='Hospital Admitted To',
+            orientation='h',
+            color='p90',
+            color_continuous_scale=px.colors.sequential.Oranges,
+            hover_data={'count': True, 'min': True, 'p50': True, 'p90': True, 'max': True},
+            labels={'mean': 'Avg. Response Time (min)', 'p50': 'Median', 'p90': '90th Percentile', 'count': 'Accidents'},
+            height=300
+        )
+        fig.update_layout(
+            margin=dict(l=20, r=20, t=30, b=10),
+            xaxis_title="Avg. Response Time (min)",
+            yaxis_title=None,
+            plot_bgcolor='black',
+            paper_bgcolor='black',
+            yaxis={'categoryorder':'total ascending'}
+        )
+        st.plotly_chart(fig, use_container_width=True)
+    else:
+        st.info("No data available for the selected filters.")
+    st.markdown("</div>", unsafe_allow_html=True)
+
 with tab2:
     st.markdown("<div class='chart-container'>", unsafe_allow_html=True)
     st.markdown("<h3 class='chart-title'>🗺️ Accident Hotspots by City & State</h3>", unsafe_allow_html=True)
@@ -631,8 +788,10 @@ with tab3:
         if st.button("Emergency Response Analysis", key="gen_response"):
             if not filtered_df.empty:
                 with st.spinner("Analyzing emergency response data..."):
-                    response_by_severity = filtered_df.groupby('Severity')['Emergency Services Response Time (min)'].agg(['mean', 'min', 'max']).reset_index()
-                    response_by_city = filtered_df.groupby('City')['Emergency Services Response Time (min)'].mean().nlargest(5).reset_index()
+                    response_by_severity = summarize_response(city_response, by='Severity')[['Severity', 'mean', 'min', 'max', 'p50', 'p90']]
+                    response_by_city = summarize_response(city_response, by='City').nlargest(5, 'mean')[['City', 'mean', 'p90']]
+                    response_by_hospital = summarize_response(hospital_response, by='Hospital Admitted To')[['Hospital Admitted To', 'mean', 'p90']]
+                    overall_avg = overall_response['mean'].iloc[0] if not overall_response.empty else np.nan
                     
                     prompt = f"""Analyze emergency response times in this accident dataset:
                     
@@ -642,7 +801,10 @@ with tab3:
                     Cities with longest average response times:
                     {response_by_city.to_string(index=False)}
                     
-                    Overall average response time: {filtered_df['Emergency Services Response Time (min)'].mean():.2f} minutes
+                    Response time by hospital admitted to:
+                    {response_by_hospital.to_string(index=False)}
+                    
+                    Overall average response time: {overall_avg:.2f} minutes
                     
                     Provide 2-3 key observations about emergency response patterns and recommendations for improvement.
                     Format with bullet points and be concise but actionable.